@@ -3,6 +3,8 @@ from tkinter import messagebox
 import tkinter.font as tk_font
 import time
 from datetime import datetime
+from itertools import groupby
+from math import ceil
 import csv
 import os
 from words_random import WordsList   # External module that provides randomized words list
@@ -18,7 +20,7 @@ class TypingSession:
         :param words (list): List of words to be typed during the session.
         """
         self.words = words
-        self.start_time = None  # Timestamp when test started
+        self.start_time_ns = None  # Monotonic timestamp in ns when test started
         self.time_left = None  # Countdown time in seconds (default 60)
         self.correct_words = None  # Count of correctly typed words
         self.correct_chars = None  # Count of correctly typed characters
@@ -26,13 +28,12 @@ class TypingSession:
         self.cpm_corrected = None  # Corrected characters per minute
         self.wpm = None  # Words per minute
         self.start()  # Start the session immediately
-        self.timer_started = False  # Flag for timer status
 
     def start(self):
         """
         Initialize or reset session variables to start a new test.
         """
-        self.start_time = time.time()
+        self.start_time_ns = time.monotonic_ns()
         self.time_left = 60
         self.correct_words = 0
         self.correct_chars = 0
@@ -57,11 +58,13 @@ class TypingSession:
         :return bool: True if the typed word matches exactly, False otherwise.
         """
         actual = self.words[self.current_word_index]
-        correct_chars = sum(1 for i in range(min(len(typed), len(actual))) if typed[i] == actual[i])
-        self.correct_chars += correct_chars
+        # Most words are typed perfectly; skip the per-character count then
         if typed == actual:
+            self.correct_chars += len(actual)
             self.correct_words += 1
             return True
+        # zip truncates to the shorter word in C, no index arithmetic needed
+        self.correct_chars += sum(1 for a, b in zip(typed, actual) if a == b)
         return False
 
     def update_metrics(self):
@@ -69,9 +72,10 @@ class TypingSession:
         Calculate and update CPM (characters per minute) and WPM (words per minute).
         :return:
         """
-        if not self.start_time:
+        if not self.start_time_ns:
             return
-        elapsed_time = max((time.time() - self.start_time) / 60, 1 / 60) # Avoid division by zero
+        # Monotonic clock is immune to wall-clock jumps; 6e10 ns per minute
+        elapsed_time = max((time.monotonic_ns() - self.start_time_ns) / 6e10, 1 / 60) # Avoid division by zero
         self.cpm_corrected = self.correct_chars / elapsed_time
         self.wpm = self.cpm_corrected / 5 # Standard WPM calculation: 5 chars per word
 
@@ -93,24 +97,46 @@ class Window:
         self.brazil_img = PhotoImage(file="icons/brazil.png") # Brazil flag icon
         self.usa_img = PhotoImage(file="icons/usa.png") # USA flag icon
 
-        # Entry widgets for displaying stats
-        self.recent_score_entry = None
-        self.corrected_cpm_entry = None
-        self.wpm_entry = None
-        self.time_entry = None
+        # StringVars backing the stat displays; updating a Label through its
+        # variable is a single Tcl call, with no readonly-state toggling
+        self._recent_score_var = StringVar()
+        self._cpm_var = StringVar()
+        self._wpm_var = StringVar()
+        self._time_var = StringVar()
 
         self.text = None  # Text widget displaying words to type
         self.typed_text_entry = None  # Entry widget for user input
+        self._typed_var = StringVar()  # Mirrors the typing Entry; its write trace drives letter checking
         self.large_font = tk_font.Font(family="Fira Mono", size=20)  # Custom font for better readability
 
         self.idiom = None  # Language identifier (e.g., "en" or "pt-br")
+        self._deadline = None  # Monotonic timestamp when the test ends
+        self._last_shown = None  # Last remaining-seconds value written to the widget
+        self._last_cpm = -1  # Last CPM integer written to the widget
+        self._last_wpm = -1  # Last WPM integer written to the widget
         self.words_list = None  # Current list of words for session
         self.after_id = None  # ID for scheduled timer callback
         self.words_indexes = []  # List of tuples with start and end positions of words in Text widget
         self.session = None  # Current TypingSession object
+        self._last_typed = ""  # Input as of the previous keystroke, used to retag only the changed slice
+        self._tagged_word_state = {}  # Word index -> word-level tag currently applied
+        self._highlighted_range = None  # (start, end) of the currently highlighted word
 
         self.timer_started = False  # Timer flag
 
+        # Score file kept open for the life of the window; the latest score is
+        # cached in memory so new sessions never reread the history from disk
+        directory = "score"
+        filename = os.path.join(directory, "score.csv")
+        os.makedirs(directory, exist_ok=True)
+        file_exist = os.path.isfile(filename)
+        self._last_score_cached = self._load_last_score(filename) if file_exist else None
+        self._score_fh = open(filename, mode="a", newline="")
+        self._score_writer = csv.writer(self._score_fh)
+        if not file_exist:
+            self._score_writer.writerow(["Date", "Lang", "CPM", "WPM"])
+            self._score_fh.flush()
+
         self.make_window()
         self.new_session()
 
@@ -129,18 +155,15 @@ class Window:
         Label(text="WPM:").grid(row=3, column=3, sticky="e", padx=(0, 5))
         Label(text="Time left:").grid(row=3, column=5, sticky="e", padx=(0, 5))
 
-        # Read-only entries showing real-time stats
-        self.recent_score_entry = Entry(self.window, width=30, state="readonly", font=self.large_font, justify="center")
-        self.recent_score_entry.grid(row=2, column=2, columnspan=5, sticky='nsew', pady=5)
+        # Labels showing real-time stats, bound to their StringVars
+        Label(self.window, textvariable=self._recent_score_var, width=30,
+              font=self.large_font, anchor="center").grid(row=2, column=2, columnspan=5, sticky='nsew', pady=5)
 
-        self.corrected_cpm_entry = Entry(self.window, width=10, state="readonly")
-        self.corrected_cpm_entry.grid(row=3, column=2, sticky="W")
+        Label(self.window, textvariable=self._cpm_var, width=10, anchor="w").grid(row=3, column=2, sticky="W")
 
-        self.wpm_entry = Entry(self.window, width=10, state="readonly")
-        self.wpm_entry.grid(row=3, column=4, sticky="W")
+        Label(self.window, textvariable=self._wpm_var, width=10, anchor="w").grid(row=3, column=4, sticky="W")
 
-        self.time_entry = Entry(self.window, width=10, state="readonly")
-        self.time_entry.grid(row=3, column=6, sticky="W")
+        Label(self.window, textvariable=self._time_var, width=10, anchor="w").grid(row=3, column=6, sticky="W")
 
         # Buttons for restart and language switching
         Button(text="Restart", command=self.reset).grid(row=3, column=7, padx=10, sticky="W")
@@ -158,10 +181,13 @@ class Window:
         self.text.tag_config("correct_word", foreground="blue")
         self.text.tag_config("wrong_word", foreground="red")
 
-        # Entry for typing input, with event bindings to check input dynamically and on space press
-        self.typed_text_entry = Entry(self.window, width=70, font=self.large_font, justify="center")
+        # Entry for typing input; the variable trace checks input only when the
+        # text actually changes (modifier and arrow keys no longer fire it),
+        # while the space binding keeps the word-boundary semantics
+        self.typed_text_entry = Entry(self.window, width=70, font=self.large_font, justify="center",
+                                      textvariable=self._typed_var)
         self.typed_text_entry.grid(row=5, column=1, columnspan=7, sticky="nsew")
-        self.typed_text_entry.bind("<KeyRelease>", self.check_typed_word)
+        self._typed_var.trace_add("write", self.check_typed_word)
         self.typed_text_entry.bind("<space>", self.space_pressed)
 
     def new_session(self):
@@ -169,18 +195,25 @@ class Window:
         Starts a new typing session by loading words and resetting the interface.
         Also displays the most recent score if available.
         """
-        self.words_list = WordsList(idiom=self.idiom).get_list()
+        self.words_list = WordsList(idiom=self.idiom, on_ready=self.words_ready).get_list()
         self.session = TypingSession(self.words_list)
         self.reset_interface()
         self.highlight_next_word()
 
         last_score = self.get_last_score()
         if last_score:
-            self.recent_score_entry.config(state="normal")
-            self.recent_score_entry.delete(0, END)
-            self.recent_score_entry.insert(0,
-                                           f"Lang: {last_score['lang']} {last_score['cpm']} CPM ({last_score['wpm']} WPM)")
-            self.recent_score_entry.config(state="readonly")
+            self._recent_score_var.set(
+                f"Lang: {last_score['lang']} {last_score['cpm']} CPM ({last_score['wpm']} WPM)")
+
+    def words_ready(self, words):
+        """
+        Called from the fetch thread once the real word list has been
+        downloaded and cached; restarts the session on the Tk thread so the
+        placeholder words are swapped for the full list.
+        :param words: (list) The fetched word list (unused, reloaded from cache).
+        """
+        _ = words
+        self.window.after(0, self.reset)
 
     def change_language(self, idiom):
         """
@@ -188,7 +221,6 @@ class Window:
         :param idiom: (str or None) Language code, e.g. "pt-br" or None for English.
         """
         self.idiom = idiom
-        self.timer_started = False
         self.reset()
 
     def highlight_next_word(self):
@@ -198,7 +230,11 @@ class Window:
         if not self.session:
             return
 
-        self.text.tag_remove("highlight", "1.0", END)
+        # Remove the highlight only where it actually is, instead of
+        # sweeping the whole widget
+        if self._highlighted_range:
+            self.text.tag_remove("highlight", *self._highlighted_range)
+            self._highlighted_range = None
 
         current_index = self.session.current_word_index
         if current_index < 0 or current_index >= len(self.words_indexes):
@@ -206,38 +242,61 @@ class Window:
 
         start, end = self.words_indexes[current_index]
         self.text.tag_add("highlight", start, end)
-        self.text.see(start)
+        self._highlighted_range = (start, end)
+        # see() forces a layout pass; only scroll when the word is off-screen
+        if self.text.bbox(start) is None:
+            self.text.see(start)
 
-    def check_typed_word(self, event):
+    def check_typed_word(self, *args):
         """
-        On every key release, compare the typed letters to the target word letters
-        and color-code correct and incorrect letters in real time.
-        :param event: The Tkinter event object (not used).
+        Whenever the input text changes, compare the typed letters to the
+        target word letters and color-code correct and incorrect letters
+        in real time.
+        :param args: Trace callback arguments from the StringVar (not used).
         :return:
         """
-        _ = event
+        _ = args
+
+        if not self.session or self.session.current_word_index == -1:
+            return
+        typed = self._typed_var.get()
 
-        if not self.timer_started:
+        # Programmatic clears also fire the trace; only real typing may
+        # start the countdown
+        if typed and not self.timer_started:
             self.timer_started = True
+            self._deadline = time.monotonic() + self.session.time_left
+            self._last_shown = None
             self.update_timer()
 
-        if not self.session or self.session.current_word_index == -1:
-            return
-        typed = self.typed_text_entry.get()
-        start, end = self.words_indexes[self.session.current_word_index]
-        actual_word = self.text.get(start, end)
-        self.text.tag_remove("correct_letter", start, end)
-        self.text.tag_remove("wrong_letter", start, end)
-
-        for i in range(len(typed)):
-            if i >= len(actual_word):
-                break
-            pos_start = f"{start}+{i}c"
-            pos_end = f"{start}+{i + 1}c"
-            if typed[i] == actual_word[i]:
-                self.text.tag_add("correct_letter", pos_start, pos_end)
-            else:
-                self.text.tag_add("wrong_letter", pos_start, pos_end)
+        last_typed = self._last_typed
+        if typed == last_typed:
+            return  # Modifier or arrow key, nothing to retag
+        # Bind the hot Text methods to locals; this handler runs per keystroke
+        text = self.text
+        tag_add = text.tag_add
+        tag_remove = text.tag_remove
+        current_index = self.session.current_word_index
+        start = self.words_indexes[current_index][0]
+        # The session holds the same text the widget shows, so no Tcl read
+        actual_word = self.session.words[current_index]
+
+        # Only the slice after the common prefix can have changed
+        common = len(os.path.commonprefix((typed, last_typed)))
+        changed_end = min(max(len(typed), len(last_typed)), len(actual_word))
+        if common < changed_end:
+            tag_remove("correct_letter", f"{start}+{common}c", f"{start}+{changed_end}c")
+            tag_remove("wrong_letter", f"{start}+{common}c", f"{start}+{changed_end}c")
+
+        # Compare the changed slice in C via map, then batch each run of
+        # equal correctness into a single tag_add
+        i = common
+        for correct, run in groupby(map(str.__eq__, typed[common:], actual_word[common:])):
+            j = i + sum(1 for _ in run)
+            tag_add("correct_letter" if correct else "wrong_letter", f"{start}+{i}c", f"{start}+{j}c")
+            i = j
+
+        self._last_typed = typed
 
     def space_pressed(self, event):
         """
@@ -257,16 +316,17 @@ class Window:
         self.update_cpm(self.session.cpm_corrected)
         self.update_wpm(self.session.wpm)
 
-        # Remove previous word highlighting
-        start, end = self.words_indexes[self.session.current_word_index]
-        self.text.tag_remove("correct_word", start, end)
-        self.text.tag_remove("wrong_word", start, end)
-
-        # Highlight current word as correct or wrong
-        if correct:
-            self.text.tag_add("correct_word", start, end)
-        else:
-            self.text.tag_add("wrong_word", start, end)
+        # Mark the word as correct or wrong, clearing (with a single call)
+        # whatever word-level tag it carried before, if any
+        text = self.text
+        current_index = self.session.current_word_index
+        start, end = self.words_indexes[current_index]
+        previous_tag = self._tagged_word_state.pop(current_index, None)
+        if previous_tag:
+            text.tag_remove(previous_tag, start, end)
+        tag = "correct_word" if correct else "wrong_word"
+        text.tag_add(tag, start, end)
+        self._tagged_word_state[current_index] = tag
 
         # Move to next word
         self.session.next_word()
@@ -280,41 +340,48 @@ class Window:
 
         # Clear typed input for next word
         self.typed_text_entry.delete(0, END)
+        self._last_typed = ""
 
         return "break"  # Prevent inserting space character
 
     def update_cpm(self, cpm):
         """
-        Update the corrected CPM display entry.
+        Update the corrected CPM display.
         :param cpm: (float) Characters per minute corrected.
         """
-        self.corrected_cpm_entry.config(state="normal")
-        self.corrected_cpm_entry.delete(0, END)
-        self.corrected_cpm_entry.insert(0, f"{int(cpm)}")
-        self.corrected_cpm_entry.config(state="readonly")
+        cpm = int(cpm)
+        if cpm == self._last_cpm:
+            return  # Displayed value would not change, skip the widget dance
+        self._last_cpm = cpm
+        self._cpm_var.set(f"{cpm}")
 
     def update_wpm(self, wpm):
         """
-        Update the WPM display entry.
+        Update the WPM display.
         :param wpm: (float) Words per minute.
         """
-        self.wpm_entry.config(state="normal")
-        self.wpm_entry.delete(0, END)
-        self.wpm_entry.insert(0, f"{int(wpm)}")
-        self.wpm_entry.config(state="readonly")
+        wpm = int(wpm)
+        if wpm == self._last_wpm:
+            return
+        self._last_wpm = wpm
+        self._wpm_var.set(f"{wpm}")
 
     def update_timer(self):
         """
-        Update the countdown timer every second.
+        Refresh the countdown against a monotonic deadline, so the test lasts
+        exactly 60 seconds regardless of callback scheduling drift.
+        The widget is rewritten only when the displayed second changes.
         When time runs out, end the test.
         """
-        self.time_entry.config(state="normal")
-        self.time_entry.delete(0, END)
-        self.time_entry.insert(0, f"{self.session.time_left}")
-        self.time_entry.config(state="readonly")
-        if self.session.time_left > 0:
-            self.session.time_left -= 1
-            self.after_id = self.window.after(1000, self.update_timer)
+        # ceil keeps the display at 60 through the first second and only
+        # reaches 0 once the deadline has actually passed
+        remaining = max(0, ceil(self._deadline - time.monotonic()))
+        self.session.time_left = remaining
+        if remaining != self._last_shown:
+            self._last_shown = remaining
+            self._time_var.set(f"{remaining}")
+        if remaining > 0:
+            self.after_id = self.window.after(200, self.update_timer)
         else:
             self.end_test()
 
@@ -324,56 +391,60 @@ class Window:
         Disable typing, display final score, save results, and notify the user.
         """
         self.typed_text_entry.config(state="disabled")
-        self.recent_score_entry.config(state="normal")
-        self.recent_score_entry.delete(0, END)
         cpm = int(self.session.cpm_corrected) if self.session.cpm_corrected else 0
         wpm = int(self.session.wpm) if self.session.wpm else 0
-        self.recent_score_entry.insert(0, f"{cpm} CPM ({wpm} WPM)")
-        self.recent_score_entry.config(state="readonly")
-        self.save_score_to_csv()
+        self._recent_score_var.set(f"{cpm} CPM ({wpm} WPM)")
+        # Write the score during idle so the notification is not delayed
+        # by disk I/O on the GUI thread
+        self.window.after_idle(self.save_score_to_csv)
         messagebox.showinfo("Time's up", "Time's up!")
 
     def save_score_to_csv(self):
         """
-        Save the current session's score (date, language, CPM, WPM) to a CSV file.
-        Creates the directory if it does not exist.
+        Append the current session's score (date, language, CPM, WPM) to the
+        already-open CSV file and refresh the in-memory last-score cache.
         """
-        directory = "score"
-        filename = os.path.join(directory, "score.csv")
-        os.makedirs(directory, exist_ok=True)
-        file_exist = os.path.isfile(filename)
-        with open(filename, mode="a", newline="") as file:
-            writer = csv.writer(file)
-            if not file_exist:
-                writer.writerow(["Date", "Lang", "CPM", "WPM"])
-            writer.writerow([
-                datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                self.idiom if self.idiom else "en",
-                int(self.session.cpm_corrected),
-                int(self.session.wpm)
-            ])
+        score = {
+            "date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "lang": self.idiom if self.idiom else "en",
+            "cpm": int(self.session.cpm_corrected),
+            "wpm": int(self.session.wpm)
+        }
+        self._score_writer.writerow([score["date"], score["lang"], score["cpm"], score["wpm"]])
+        self._score_fh.flush()
+        self._last_score_cached = score
+
+    def get_last_score(self):
+        """
+        Returns the most recent score.
+        The value is kept in memory, so no disk access happens after startup.
+        :return  dict or None: Last score data with keys 'date', 'lang', 'cpm', 'wpm' or None if no data.
+        """
+        return self._last_score_cached
 
     @staticmethod
-    def get_last_score():
+    def _load_last_score(filename):
         """
-        Reads the last saved score from the CSV file, if available.
+        Reads the last saved score from the CSV file on startup.
+        Only the tail of the file is read, so the cost stays constant
+        as the score history grows.
+        :param filename: (str) Path to the score CSV file (must exist).
         :return  dict or None: Last score data with keys 'date', 'lang', 'cpm', 'wpm' or None if no data.
         """
-        directory = "score"
-        filename = os.path.join(directory, "score.csv")
-        if not os.path.exists(filename):
-            return None
-        with open(filename, mode="r", newline="") as file:
-            reader = list(csv.reader(file))
-            if len(reader) <= 1:
-                return None
-            last_row = reader[-1]
-            return {
-                "date": last_row[0],
-                "lang": last_row[1],
-                "cpm": int(last_row[2]),
-                "wpm": int(last_row[3])
-            }
+        with open(filename, mode="rb") as file:
+            file.seek(0, os.SEEK_END)
+            size = file.tell()
+            file.seek(max(0, size - 512))
+            lines = [line for line in file.read().split(b"\n") if line.strip()]
+        if size <= 512 and len(lines) <= 1:
+            return None  # Only the header row exists so far
+        last_row = next(csv.reader([lines[-1].decode()]))
+        return {
+            "date": last_row[0],
+            "lang": last_row[1],
+            "cpm": int(last_row[2]),
+            "wpm": int(last_row[3])
+        }
 
     def reset(self):
         """
@@ -395,31 +466,34 @@ class Window:
         """
         Reset the UI text widgets to display the new list of words and clear inputs.
         """
+        self._tagged_word_state.clear()
+        self._highlighted_range = None
+
         self.text.config(state="normal")
         self.text.delete("1.0", END)
         self.words_indexes.clear()
 
-        index = "1.0"
+        # Insert the whole passage at once and compute the word indexes in
+        # Python; words sit on a single logical line, so every index is
+        # "1.<char offset>" and no Tcl index arithmetic is needed
+        self.text.insert("1.0", " ".join(self.words_list) + " ")
+        append = self.words_indexes.append
+        offset = 0
         for word in self.words_list:
-            self.text.insert(index, word + " ")
-            start_index = index
-            end_index = self.text.index(f"{start_index}+{len(word)}c")
-            self.words_indexes.append((start_index, end_index))
-            index = self.text.index(f"{end_index}+1c")
+            append((f"1.{offset}", f"1.{offset + len(word)}"))
+            offset += len(word) + 1
 
         self.typed_text_entry.config(state="normal")
         self.typed_text_entry.delete(0, END)
         self.typed_text_entry.focus()
+        self._last_typed = ""
 
-        for entry in (self.corrected_cpm_entry, self.wpm_entry):
-            entry.config(state="normal")
-            entry.delete(0, END)
-            entry.config(state="readonly")
+        self._cpm_var.set("")
+        self._wpm_var.set("")
+        self._last_cpm = -1
+        self._last_wpm = -1
 
-        self.time_entry.config(state="normal")
-        self.time_entry.delete(0, END)
-        self.time_entry.insert(0, "60")
-        self.time_entry.config(state="readonly")
+        self._time_var.set("60")
 
 if __name__ == "__main__":
     app = Window()
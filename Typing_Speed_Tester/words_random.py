@@ -1,27 +1,85 @@
+import json
+import os
+import threading
 import requests
 from random import sample
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional; stdlib json decodes the same payload
+    _json_loads = json.loads
+
+CACHE_DIR = "cache"
+
+# Fallback list in case of API failure, also shown while a fetch is in progress
+FALLBACK_WORDS = ["default", "word", "list", "in", "case", "of", "error"]
+
+
 class WordsList:
     """
     A class to retrieve a list of random words from an online API
     based on the specified language.
+    Responses are cached on disk per idiom, so only the very first session
+    for a language hits the network; later sessions load instantly.
     Attributes:
         idiom (str): Language code for the desired words.
-        words_list (list): List of words retrieved from the API.
+        words_list (list): List of words retrieved from the API or cache.
+        on_ready (callable): Optional callback invoked (from a background
+                             thread) once a network fetch completes.
     """
-    def __init__(self, idiom = None):
+    # Filtered word pool per idiom, shared across instances so Restart and
+    # language switches skip re-filtering the full dictionary
+    _filtered_cache = {}
+
+    def __init__(self, idiom = None, on_ready = None):
         """
         Initialize the WordsList object with an optional language code.
         :param idiom: (str, optional) The language code (e.g., 'en', 'pt-br').
                                       Defaults to None for English.
+        :param on_ready: (callable, optional) Called with the fetched words once
+                                              a background fetch finishes. When given,
+                                              a cache miss returns placeholder words
+                                              immediately instead of blocking.
         """
         self.words_list = None
         self.idiom = idiom
+        self.on_ready = on_ready
         self.get_words(self.idiom)
 
+    @staticmethod
+    def cache_file(idiom):
+        """
+        Build the on-disk cache path for the given language code.
+        :param idiom: (str) The language code, or None for English.
+        :return str: Path of the per-idiom cache file.
+        """
+        return os.path.join(CACHE_DIR, f"words_{idiom if idiom else 'en'}.json")
+
     def get_words(self, idiom):
         """
-        Fetches the list of words from the random-word-api.
+        Loads the list of words for the given idiom, preferring the disk cache.
+        On a cache miss the fetch runs in a background thread (when an
+        `on_ready` callback was given) so the GUI never blocks on the network.
+        :param idiom: (str) The language code for the API query.
+        """
+        try:
+            with open(self.cache_file(idiom), mode="r", encoding="utf-8") as file:
+                self.words_list = json.load(file)
+            return
+        except (OSError, ValueError):
+            pass  # No usable cache yet, fetch from the API
+
+        if self.on_ready:
+            # Show placeholder words immediately; swap in the real list later
+            self.words_list = FALLBACK_WORDS
+            threading.Thread(target=self.fetch_words, args=(idiom,), daemon=True).start()
+        else:
+            self.fetch_words(idiom)
+
+    def fetch_words(self, idiom):
+        """
+        Fetches the list of words from the random-word-api and caches it on disk.
         :param idiom: (str) The language code for the API query.
         """
         try:
@@ -30,13 +88,23 @@ class WordsList:
             else:
                 url = f"https://random-word-api.herokuapp.com/all?lang={idiom}"
 
-            # Send GET request to the API
-            self.words_list = requests.get(url, timeout = 5).json()
+            # Send GET request to the API; decode the raw body directly,
+            # skipping .json()'s content-type sniffing and slower stdlib path
+            response = requests.get(url, timeout = 5, headers = {"Accept-Encoding": "gzip"})
+            words = _json_loads(response.content)
+
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            with open(self.cache_file(idiom), mode="w", encoding="utf-8") as file:
+                json.dump(words, file)
         except Exception as e:
             print(f"Unable to load words: {e}")
             # Fallback list in case of API failure
-            self.words_list = ["default", "word", "list", "in", "case", "of", "error"]
+            self.words_list = FALLBACK_WORDS
+            return
 
+        self.words_list = words
+        if self.on_ready:
+            self.on_ready(words)
 
     def get_list(self):
         """
@@ -44,12 +112,20 @@ class WordsList:
 
         - Only selects words of length <= 8.
         - Randomly selects up to 200 words.
+        The filtered pool is memoized per idiom, so only the first session
+        for a language pays for the full scan.
         :return ist: A list of up to 200 short words.
         """
-        # Filter for words with max length of 8
-        filtered_words = [word for word in self.words_list if len(word) <= 8]
+        filtered_words = self._filtered_cache.get(self.idiom)
+
+        if filtered_words is None:
+            # Filter for words with max length of 8; a tuple is safe to share
+            # across sessions since nothing can mutate it
+            filtered_words = tuple(word for word in self.words_list if len(word) <= 8)
 
-        # Randomly sample up to 200 words
-        words = sample(filtered_words, min(200, len(filtered_words)))
+            # Placeholder words must not shadow the real list once it arrives
+            if self.words_list is not FALLBACK_WORDS:
+                self._filtered_cache[self.idiom] = filtered_words
 
-        return words
+        # Randomly sample up to 200 words straight from the shared pool
+        return sample(filtered_words, min(200, len(filtered_words)))